@@ -66,6 +66,30 @@ class CompareValueTrigger(object):
         self._summary = chainer.reporter.DictSummary()
 
 
+def save_attention_image(att_w, filename):
+    """Save the attention weights as a grayscale image without matplotlib.
+
+    The values are min-max normalized into [0, 255], so that the features with
+    negative values (e.g., log-mel filterbanks) are also saved correctly, and the
+    heads of multi-head attention are tiled horizontally.
+
+    Args:
+        att_w (numpy.ndarray): Attention weights (H, L, T) or (L, T).
+        filename (str): Filename to save the image.
+
+    """
+    from PIL import Image
+
+    att_w = att_w.astype(np.float32)
+    if len(att_w.shape) == 3:
+        att_w = np.concatenate(list(att_w), axis=1)
+    att_w = att_w - att_w.min()
+    max_value = att_w.max()
+    if max_value > 0:
+        att_w = att_w / max_value
+    Image.fromarray((att_w * 255).astype(np.uint8)).save(filename)
+
+
 try:
     from chainer.training import extension
 except ImportError:
@@ -93,6 +117,12 @@ else:
             oaxis (int): Dimension to access output
                 (for ASR/ST oaxis=0, for MT oaxis=0.)
             subsampling_factor (int): subsampling factor in encoder
+            use_matplotlib (bool): If False, save the attention weights as an image
+                without axes or labels using PIL instead of rendering a matplotlib
+                figure, which is much faster. Hierarchical attention is always
+                plotted with matplotlib.
+            chunk_size (int): Number of utterances to calculate attention weights
+                at once, which bounds the peak memory usage.
 
         """
 
@@ -110,6 +140,8 @@ else:
             okey="output",
             oaxis=0,
             subsampling_factor=1,
+            use_matplotlib=True,
+            chunk_size=8,
         ):
             self.att_vis_fn = att_vis_fn
             self.data = copy.deepcopy(data)
@@ -125,92 +157,105 @@ else:
             self.okey = okey
             self.oaxis = oaxis
             self.factor = subsampling_factor
+            self.use_matplotlib = use_matplotlib
+            self.chunk_size = chunk_size
             if not os.path.exists(self.outdir):
                 os.makedirs(self.outdir)
 
         def __call__(self, trainer):
             """Plot and save image file of att_ws matrix."""
-            att_ws, uttid_list = self.get_attention_weights()
-            if isinstance(att_ws, list):  # multi-encoder case
-                num_encs = len(att_ws) - 1
-                # atts
-                for i in range(num_encs):
-                    for idx, att_w in enumerate(att_ws[i]):
-                        filename = "%s/%s.ep.{.updater.epoch}.att%d.png" % (
+            for att_ws, uttid_list in self.iter_attention_weights():
+                if isinstance(att_ws, list):  # multi-encoder case
+                    num_encs = len(att_ws) - 1
+                    # atts
+                    for i in range(num_encs):
+                        for idx, att_w in enumerate(att_ws[i]):
+                            filename = "%s/%s.ep.{.updater.epoch}.att%d.png" % (
+                                self.outdir,
+                                uttid_list[idx],
+                                i + 1,
+                            )
+                            att_w = self.trim_attention_weight(uttid_list[idx], att_w)
+                            np_filename = "%s/%s.ep.{.updater.epoch}.att%d.npy" % (
+                                self.outdir,
+                                uttid_list[idx],
+                                i + 1,
+                            )
+                            np.save(np_filename.format(trainer), att_w)
+                            self._plot_and_save_attention(
+                                att_w, filename.format(trainer)
+                            )
+                    # han
+                    for idx, att_w in enumerate(att_ws[num_encs]):
+                        filename = "%s/%s.ep.{.updater.epoch}.han.png" % (
                             self.outdir,
                             uttid_list[idx],
-                            i + 1,
                         )
                         att_w = self.trim_attention_weight(uttid_list[idx], att_w)
-                        np_filename = "%s/%s.ep.{.updater.epoch}.att%d.npy" % (
+                        np_filename = "%s/%s.ep.{.updater.epoch}.han.npy" % (
+                            self.outdir,
+                            uttid_list[idx],
+                        )
+                        np.save(np_filename.format(trainer), att_w)
+                        self._plot_and_save_attention(
+                            att_w, filename.format(trainer), han_mode=True
+                        )
+                else:
+                    for idx, att_w in enumerate(att_ws):
+                        filename = "%s/%s.ep.{.updater.epoch}.png" % (
+                            self.outdir,
+                            uttid_list[idx],
+                        )
+                        att_w = self.trim_attention_weight(uttid_list[idx], att_w)
+                        np_filename = "%s/%s.ep.{.updater.epoch}.npy" % (
                             self.outdir,
                             uttid_list[idx],
-                            i + 1,
                         )
                         np.save(np_filename.format(trainer), att_w)
                         self._plot_and_save_attention(att_w, filename.format(trainer))
-                # han
-                for idx, att_w in enumerate(att_ws[num_encs]):
-                    filename = "%s/%s.ep.{.updater.epoch}.han.png" % (
-                        self.outdir,
-                        uttid_list[idx],
-                    )
-                    att_w = self.trim_attention_weight(uttid_list[idx], att_w)
-                    np_filename = "%s/%s.ep.{.updater.epoch}.han.npy" % (
-                        self.outdir,
-                        uttid_list[idx],
-                    )
-                    np.save(np_filename.format(trainer), att_w)
-                    self._plot_and_save_attention(
-                        att_w, filename.format(trainer), han_mode=True
-                    )
-            else:
-                for idx, att_w in enumerate(att_ws):
-                    filename = "%s/%s.ep.{.updater.epoch}.png" % (
-                        self.outdir,
-                        uttid_list[idx],
-                    )
-                    att_w = self.trim_attention_weight(uttid_list[idx], att_w)
-                    np_filename = "%s/%s.ep.{.updater.epoch}.npy" % (
-                        self.outdir,
-                        uttid_list[idx],
-                    )
-                    np.save(np_filename.format(trainer), att_w)
-                    self._plot_and_save_attention(att_w, filename.format(trainer))
 
         def log_attentions(self, logger, step):
             """Add image files of att_ws matrix to the tensorboard."""
-            att_ws, uttid_list = self.get_attention_weights()
-            if isinstance(att_ws, list):  # multi-encoder case
-                num_encs = len(att_ws) - 1
-                # atts
-                for i in range(num_encs):
-                    for idx, att_w in enumerate(att_ws[i]):
+            for att_ws, uttid_list in self.iter_attention_weights():
+                if isinstance(att_ws, list):  # multi-encoder case
+                    num_encs = len(att_ws) - 1
+                    # atts
+                    for i in range(num_encs):
+                        for idx, att_w in enumerate(att_ws[i]):
+                            att_w = self.trim_attention_weight(uttid_list[idx], att_w)
+                            plot = self.draw_attention_plot(att_w)
+                            logger.add_figure(
+                                "%s_att%d" % (uttid_list[idx], i + 1),
+                                plot.gcf(),
+                                step,
+                            )
+                    # han
+                    for idx, att_w in enumerate(att_ws[num_encs]):
                         att_w = self.trim_attention_weight(uttid_list[idx], att_w)
-                        plot = self.draw_attention_plot(att_w)
+                        plot = self.draw_han_plot(att_w)
                         logger.add_figure(
-                            "%s_att%d" % (uttid_list[idx], i + 1),
+                            "%s_han" % (uttid_list[idx]),
                             plot.gcf(),
                             step,
                         )
-                # han
-                for idx, att_w in enumerate(att_ws[num_encs]):
-                    att_w = self.trim_attention_weight(uttid_list[idx], att_w)
-                    plot = self.draw_han_plot(att_w)
-                    logger.add_figure(
-                        "%s_han" % (uttid_list[idx]),
-                        plot.gcf(),
-                        step,
-                    )
-            else:
-                for idx, att_w in enumerate(att_ws):
-                    att_w = self.trim_attention_weight(uttid_list[idx], att_w)
-                    plot = self.draw_attention_plot(att_w)
-                    logger.add_figure("%s" % (uttid_list[idx]), plot.gcf(), step)
+                else:
+                    for idx, att_w in enumerate(att_ws):
+                        att_w = self.trim_attention_weight(uttid_list[idx], att_w)
+                        plot = self.draw_attention_plot(att_w)
+                        logger.add_figure("%s" % (uttid_list[idx]), plot.gcf(), step)
 
-        def get_attention_weights(self):
+        def iter_attention_weights(self):
+            """Yield attention weights and utterance IDs for each chunk of data."""
+            for i in range(0, len(self.data), self.chunk_size):
+                yield self.get_attention_weights(self.data[i : i + self.chunk_size])
+
+        def get_attention_weights(self, data=None):
             """Return attention weights.
 
+            Args:
+                data (list[tuple(str, dict[str, list[Any]])]): List json utt key
+                    items. If None, self.data is used.
+
             Returns:
                 numpy.ndarray: attention weights. float. Its shape would be
                     differ from backend.
@@ -219,7 +264,9 @@ else:
                     * chainer-> (B, Lmax, Tmax)
 
             """
-            return_batch, uttid_list = self.transform(self.data, return_uttid=True)
+            if data is None:
+                data = self.data
+            return_batch, uttid_list = self.transform(data, return_uttid=True)
             batch = self.converter([return_batch], self.device)
             if isinstance(batch, tuple):
                 att_ws = self.att_vis_fn(*batch)
@@ -313,6 +360,9 @@ else:
             return plt
 
         def _plot_and_save_attention(self, att_w, filename, han_mode=False):
+            if not self.use_matplotlib and not han_mode:
+                save_attention_image(att_w, filename)
+                return
             if han_mode:
                 plt = self.draw_han_plot(att_w)
             else:
@@ -619,12 +619,14 @@ def train(args):
         load_output=True,
         preprocess_conf=args.preprocess_conf,
         preprocess_args={"train": True},  # Switch the mode of preprocessing
+        num_workers=args.n_load_threads,
     )
     load_cv = LoadInputsAndTargets(
         mode="asr",
         load_output=True,
         preprocess_conf=args.preprocess_conf,
         preprocess_args={"train": False},  # Switch the mode of preprocessing
+        num_workers=args.n_load_threads,
     )
     # hack to make batchsize argument as 1
     # actual bathsize is included in a list
@@ -708,6 +710,7 @@ def train(args):
             transform=load_cv,
             device=device,
             subsampling_factor=total_subsampling_factor,
+            use_matplotlib=args.plot_attention_with_matplotlib,
         )
         trainer.extend(att_reporter, trigger=(1, "epoch"))
     else:
@@ -261,6 +261,13 @@ def get_parser(parser=None, required=True):
         type=int,
         help="Number of processes of iterator",
     )
+    parser.add_argument(
+        "--n-load-threads",
+        default=0,
+        type=int,
+        help="Number of threads to load the features of each mini-batch "
+        "(pytorch backend only)",
+    )
     parser.add_argument(
         "--preprocess-conf",
         type=str,
@@ -325,6 +332,14 @@ def get_parser(parser=None, required=True):
         type=int,
         help="Number of samples of attention to be saved",
     )
+    parser.add_argument(
+        "--plot-attention-with-matplotlib",
+        type=strtobool,
+        default=True,
+        help="If false, save the attention weights as images without axes and "
+        "labels using PIL, which is much faster than matplotlib "
+        "(pytorch backend only)",
+    )
     parser.add_argument(
         "--num-save-ctc",
         default=3,
@@ -600,9 +615,9 @@ def main(cmd_args):
     # load dictionary for debug log
     if args.dict is not None:
         with open(args.dict, "rb") as f:
-            dictionary = f.readlines()
-        char_list = [entry.decode("utf-8").split(" ")[0] for entry in dictionary]
-        char_list.insert(0, "<blank>")
+            char_list = ["<blank>"] + [
+                entry.split(b" ", 1)[0].decode("utf-8") for entry in f
+            ]
         char_list.append("<eos>")
         # for non-autoregressive maskctc model
         if "maskctc" in args.model_module:
@@ -263,9 +263,9 @@ def main(cmd_args):
 
     # load dictionary
     with open(args.dict, "rb") as f:
-        dictionary = f.readlines()
-    char_list = [entry.decode("utf-8").split(" ")[0] for entry in dictionary]
-    char_list.insert(0, "<blank>")
+        char_list = ["<blank>"] + [
+            entry.split(b" ", 1)[0].decode("utf-8") for entry in f
+        ]
     char_list.append("<eos>")
     args.char_list_dict = {x: i for i, x in enumerate(char_list)}
     args.n_vocab = len(char_list)
@@ -452,9 +452,9 @@ def main(cmd_args):
     # load dictionary for debug log
     if args.dict is not None:
         with open(args.dict, "rb") as f:
-            dictionary = f.readlines()
-        char_list = [entry.decode("utf-8").split(" ")[0] for entry in dictionary]
-        char_list.insert(0, "<blank>")
+            char_list = ["<blank>"] + [
+                entry.split(b" ", 1)[0].decode("utf-8") for entry in f
+            ]
         char_list.append("<eos>")
         args.char_list = char_list
     else:
@@ -276,6 +276,13 @@ def get_parser(parser=None, required=True):
         type=int,
         help="Number of processes of iterator",
     )
+    parser.add_argument(
+        "--n-load-threads",
+        default=0,
+        type=int,
+        help="Number of threads to load the features of each mini-batch "
+        "(pytorch backend only)",
+    )
     parser.add_argument(
         "--preprocess-conf",
         type=str,
@@ -523,9 +530,9 @@ def main(cmd_args):
     # load dictionary for debug log
     if args.dict is not None:
         with open(args.dict, "rb") as f:
-            dictionary = f.readlines()
-        char_list = [entry.decode("utf-8").split(" ")[0] for entry in dictionary]
-        char_list.insert(0, "<blank>")
+            char_list = ["<blank>"] + [
+                entry.split(b" ", 1)[0].decode("utf-8") for entry in f
+            ]
         char_list.append("<eos>")
         args.char_list = char_list
     else:
@@ -4,6 +4,7 @@
 """TTS-Transformer related modules."""
 
 import logging
+import os
 
 import torch
 import torch.nn.functional as F
@@ -89,10 +90,12 @@ else:
                     Values should be numpy.ndarray (H, L, T)
                 outdir (str): Directory name to save figures.
                 suffix (str): Filename suffix including image type (e.g., png).
-                savefn (function): Function to save figures.
+                savefn (function): Function to save figures. If None, save the
+                    attention weights as images without matplotlib.
 
             """
             import matplotlib.pyplot as plt
+            from espnet.asr.asr_utils import save_attention_image
             from espnet.nets.pytorch_backend.transformer.plot import (
                 _plot_and_save_attention,  # noqa: H301
             )
@@ -100,6 +103,10 @@ else:
             for name, att_ws in attn_dict.items():
                 for utt_id, att_w in zip(uttid_list, att_ws):
                     filename = "%s/%s.%s.%s" % (outdir, utt_id, name, suffix)
+                    if savefn is None:
+                        os.makedirs(outdir, exist_ok=True)
+                        save_attention_image(att_w, filename)
+                        continue
                     if "fbank" in name:
                         fig = plt.Figure()
                         ax = fig.subplots(1, 1)
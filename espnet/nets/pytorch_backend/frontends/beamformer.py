@@ -1,3 +1,5 @@
+import contextlib
+
 import torch
 from torch_complex import functional as FC
 from torch_complex.tensor import ComplexTensor
@@ -68,7 +70,7 @@ def get_mvdr_vector(
     psd_n += eps * eye
 
     # numerator: (..., C_1, C_2) x (..., C_2, C_3) -> (..., C_1, C_3)
-    numerator = FC.einsum("...ec,...cd->...ed", [psd_n.inverse(), psd_s])
+    numerator = FC.einsum("...ec,...cd->...ed", [inverse_fp32(psd_n), psd_s])
     # ws: (..., C, C) / (...,) -> (..., C, C)
     ws = numerator / (FC.trace(numerator)[..., None, None] + eps)
     # h: (..., F, C_1, C_2) x (..., C_2) -> (..., F, C_1)
@@ -76,6 +78,37 @@ def get_mvdr_vector(
     return beamform_vector
 
 
+def autocast_disabled(device: torch.device):
+    """Return a context to calculate numerically sensitive parts in FP32.
+
+    Args:
+        device (torch.device): Device of the tensors calculated in the context.
+    Returns:
+        context: Context manager disabling autocast.
+    """
+    if hasattr(torch, "autocast"):
+        return torch.autocast(device_type=device.type, enabled=False)
+    if hasattr(torch.cuda, "amp"):
+        # torch<1.10.0 supports autocast only on CUDA
+        return torch.cuda.amp.autocast(enabled=False)
+    # Nothing to do if torch<1.6.0
+    return contextlib.nullcontext()
+
+
+def inverse_fp32(mat: ComplexTensor) -> ComplexTensor:
+    """Calculate the matrix inverse in FP32 even if autocast is enabled.
+
+    Args:
+        mat (ComplexTensor): (..., C, C)
+    Returns:
+        inverse (ComplexTensor): (..., C, C)
+    """
+    with autocast_disabled(mat.device):
+        if mat.dtype in (torch.float16, torch.bfloat16):
+            mat = mat.to(torch.float32)
+        return mat.inverse()
+
+
 def apply_beamforming_vector(
     beamform_vector: ComplexTensor, mix: ComplexTensor
 ) -> ComplexTensor:
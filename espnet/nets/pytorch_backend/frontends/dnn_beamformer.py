@@ -168,5 +168,8 @@ class AttentionReference(torch.nn.Module):
         mlp_psd = self.mlp_psd(psd_feat)
         # (B, C, F2) -> (B, C, 1) -> (B, C)
         e = self.gvec(torch.tanh(mlp_psd)).squeeze(-1)
+        # NOTE: the softmax for the reference channel stays in FP32 under autocast
+        if e.dtype in (torch.float16, torch.bfloat16):
+            e = e.float()
         u = F.softmax(scaling * e, dim=-1)
         return u, ilens
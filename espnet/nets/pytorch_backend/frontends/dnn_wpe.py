@@ -4,6 +4,7 @@ from pytorch_wpe import wpe_one_iteration
 import torch
 from torch_complex.tensor import ComplexTensor
 
+from espnet.nets.pytorch_backend.frontends.beamformer import autocast_disabled
 from espnet.nets.pytorch_backend.frontends.mask_estimator import MaskEstimator
 from espnet.nets.pytorch_backend.nets_utils import make_pad_mask
 
@@ -76,13 +77,16 @@ class DNN_WPE(torch.nn.Module):
             power = power.mean(dim=-2)
 
             # enhanced: (..., C, T) -> (..., C, T)
-            enhanced = wpe_one_iteration(
-                data.contiguous(),
-                power,
-                taps=self.taps,
-                delay=self.delay,
-                inverse_power=self.inverse_power,
-            )
+            # NOTE: the filter estimation solves a linear system, so it is always
+            #   calculated in FP32 even if autocast is enabled
+            with autocast_disabled(data.device):
+                enhanced = wpe_one_iteration(
+                    data.contiguous(),
+                    power.to(data.dtype),
+                    taps=self.taps,
+                    delay=self.delay,
+                    inverse_power=self.inverse_power,
+                )
 
             enhanced.masked_fill_(make_pad_mask(ilens, enhanced.real), 0)
 
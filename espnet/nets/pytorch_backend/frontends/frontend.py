@@ -1,3 +1,5 @@
+import contextlib
+import logging
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -36,9 +38,27 @@ class Frontend(nn.Module):
         badim: int = 320,
         ref_channel: int = -1,
         bdropout_rate=0.0,
+        # Mixed precision options
+        amp_dtype: Optional[torch.dtype] = None,
     ):
         super().__init__()
 
+        if (
+            amp_dtype is not None
+            and amp_dtype != torch.float16
+            and not hasattr(torch, "autocast")
+        ):
+            # NOTE: torch<1.10 supports only float16 autocast on CUDA
+            logging.warning(
+                f"amp_dtype={amp_dtype} requires torch>=1.10, "
+                f"use torch.float16 instead: torch={torch.__version__}"
+            )
+            amp_dtype = torch.float16
+        # NOTE: If amp_dtype is given, WPE and beamformer run under autocast.
+        #   The WPE filter estimation, the matrix inverse in MVDR, and the softmax
+        #   for the reference channel selection are still calculated in FP32.
+        self.amp_dtype = amp_dtype
+
         self.use_beamformer = use_beamformer
         self.use_wpe = use_wpe
         self.use_dnn_mask_for_wpe = use_dnn_mask_for_wpe
@@ -85,9 +105,26 @@ class Frontend(nn.Module):
         else:
             self.beamformer = None
 
+        # Candidates of (use_wpe, use_beamformer) randomly chosen in training.
+        # NOTE: They don't change after initialization, so build them only once
+        #   instead of in every forward.
+        self.train_choices = [(False, False)] if not self.use_frontend_for_all else []
+        if self.use_wpe:
+            self.train_choices.append((True, False))
+        if self.use_beamformer:
+            self.train_choices.append((False, True))
+
+        # Neither WPE nor beamformer is applied, i.e., the input is passed through
+        self.is_noop = not (self.use_wpe or self.use_beamformer)
+
     def forward(
         self, x: ComplexTensor, ilens: Union[torch.LongTensor, numpy.ndarray, List[int]]
     ) -> Tuple[ComplexTensor, torch.LongTensor, Optional[ComplexTensor]]:
+        if self.is_noop:
+            # NOTE: ilens is returned as it is since the following feature transform
+            #   converts it to a tensor if needed
+            return x, ilens, None
+
         assert len(x) == len(ilens), (len(x), len(ilens))
         # (B, T, F) or (B, T, C, F)
         if x.dim() not in (3, 4):
@@ -99,28 +136,39 @@ class Frontend(nn.Module):
         h = x
         if h.dim() == 4:
             if self.training:
-                choices = [(False, False)] if not self.use_frontend_for_all else []
-                if self.use_wpe:
-                    choices.append((True, False))
-
-                if self.use_beamformer:
-                    choices.append((False, True))
-
-                use_wpe, use_beamformer = choices[numpy.random.randint(len(choices))]
+                choices = self.train_choices
+                if len(choices) == 1:
+                    # No need to draw a random number
+                    use_wpe, use_beamformer = choices[0]
+                else:
+                    idx = numpy.random.randint(len(choices))
+                    use_wpe, use_beamformer = choices[idx]
 
             else:
                 use_wpe = self.use_wpe
                 use_beamformer = self.use_beamformer
 
-            # 1. WPE
-            if use_wpe:
-                # h: (B, T, C, F) -> h: (B, T, C, F)
-                h, ilens, mask = self.wpe(h, ilens)
-
-            # 2. Beamformer
-            if use_beamformer:
-                # h: (B, T, C, F) -> h: (B, T, F)
-                h, ilens, mask = self.beamformer(h, ilens)
+            if self.amp_dtype is None:
+                amp = contextlib.nullcontext()
+            elif hasattr(torch, "autocast"):
+                amp = torch.autocast(device_type=h.device.type, dtype=self.amp_dtype)
+            else:
+                amp = torch.cuda.amp.autocast()
+
+            with amp:
+                # 1. WPE
+                if use_wpe:
+                    # h: (B, T, C, F) -> h: (B, T, C, F)
+                    h, ilens, mask = self.wpe(h, ilens)
+
+                # 2. Beamformer
+                if use_beamformer:
+                    # h: (B, T, C, F) -> h: (B, T, F)
+                    h, ilens, mask = self.beamformer(h, ilens)
+
+            # Keep the output dtype same as the input for the feature transform
+            if h.dtype != x.dtype:
+                h = h.to(x.dtype)
 
         return h, ilens, mask
 
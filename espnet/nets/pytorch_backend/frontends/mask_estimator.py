@@ -13,7 +13,7 @@ from espnet.nets.pytorch_backend.rnn.encoders import RNNP
 class MaskEstimator(torch.nn.Module):
     def __init__(self, type, idim, layers, units, projs, dropout, nmask=1):
         super().__init__()
-        subsample = np.ones(layers + 1, dtype=np.int)
+        subsample = np.ones(layers + 1, dtype=int)
 
         typ = type.lstrip("vgg").rstrip("p")
         if type[-1] == "p":
@@ -51,14 +51,11 @@ def pad_list(xs, pad_value):
                 [1., 0., 0., 0.]])
 
     """
-    n_batch = len(xs)
-    max_len = max(x.size(0) for x in xs)
-    pad = xs[0].new(n_batch, max_len, *xs[0].size()[1:]).fill_(pad_value)
-
-    for i in range(n_batch):
-        pad[i, : xs[i].size(0)] = xs[i]
-
-    return pad
+    # NOTE: pad_sequence allocates the padded tensor once and copies the inputs
+    #   in C++, which avoids the per-utterance python loop.
+    return torch.nn.utils.rnn.pad_sequence(
+        xs, batch_first=True, padding_value=pad_value
+    )
 
 def pad_list_even_max_length(xs, pad_value):
     """Perform padding for the list of tensors.
@@ -84,7 +81,7 @@ def pad_list_even_max_length(xs, pad_value):
     max_len = max(x.size(0) for x in xs)
     if max_len % 2 != 0:
         max_len += 1
-    pad = xs[0].new(n_batch, max_len, *xs[0].size()[1:]).fill_(pad_value)
+    pad = xs[0].new_full((n_batch, max_len, *xs[0].size()[1:]), pad_value)
 
     for i in range(n_batch):
         pad[i, : xs[i].size(0)] = xs[i]
@@ -68,7 +68,8 @@ def plot_multi_head_attention(
         values should be torch.Tensor (head, input_length, output_length)
     :param str outdir: dir to save fig
     :param str suffix: filename suffix including image type (e.g., png)
-    :param savefn: function to save
+    :param savefn: function to save. If None, save the attention weights as
+        images without matplotlib (see espnet.asr.asr_utils.save_attention_image)
     :param str ikey: key to access input
     :param int iaxis: dimension to access input
     :param str okey: key to access output
@@ -110,6 +111,10 @@ def plot_multi_head_attention(
                         xtokens = data_i[ikey][iaxis]["token"].split()
             else:
                 logging.warning("unknown name for shaping attention")
+            if savefn is None:
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                asr_utils.save_attention_image(att_w, filename)
+                continue
             fig = _plot_and_save_attention(att_w, filename, xtokens, ytokens)
             savefn(fig, filename)
 
@@ -124,12 +129,17 @@ class PlotAttentionReport(asr_utils.PlotAttentionReport):
         plot_multi_head_attention(*args, **kwargs)
 
     def __call__(self, trainer):
-        attn_dict, uttid_list = self.get_attention_weights()
         suffix = "ep.{.updater.epoch}.png".format(trainer)
-        self.plotfn(self.data_dict, uttid_list, attn_dict, self.outdir, suffix, savefig)
-
-    def get_attention_weights(self):
-        return_batch, uttid_list = self.transform(self.data, return_uttid=True)
+        savefn = savefig if self.use_matplotlib else None
+        for attn_dict, uttid_list in self.iter_attention_weights():
+            self.plotfn(
+                self.data_dict, uttid_list, attn_dict, self.outdir, suffix, savefn
+            )
+
+    def get_attention_weights(self, data=None):
+        if data is None:
+            data = self.data
+        return_batch, uttid_list = self.transform(data, return_uttid=True)
         batch = self.converter([return_batch], self.device)
         if isinstance(batch, tuple):
             att_ws = self.att_vis_fn(*batch)
@@ -142,5 +152,5 @@ class PlotAttentionReport(asr_utils.PlotAttentionReport):
             logger.add_figure(os.path.basename(filename), plot, step)
             plt.clf()
 
-        attn_dict, uttid_list = self.get_attention_weights()
-        self.plotfn(self.data_dict, uttid_list, attn_dict, self.outdir, "", log_fig)
+        for attn_dict, uttid_list in self.iter_attention_weights():
+            self.plotfn(self.data_dict, uttid_list, attn_dict, self.outdir, "", log_fig)
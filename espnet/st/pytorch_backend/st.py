@@ -277,12 +277,14 @@ def train(args):
         load_output=True,
         preprocess_conf=args.preprocess_conf,
         preprocess_args={"train": True},  # Switch the mode of preprocessing
+        num_workers=args.n_load_threads,
     )
     load_cv = LoadInputsAndTargets(
         mode="asr",
         load_output=True,
         preprocess_conf=args.preprocess_conf,
         preprocess_args={"train": False},  # Switch the mode of preprocessing
+        num_workers=args.n_load_threads,
     )
     # hack to make batchsize argument as 1
     # actual bathsize is included in a list
@@ -1,7 +1,10 @@
 from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 import io
 import logging
 import os
+import threading
 
 import h5py
 import kaldiio
@@ -11,6 +14,22 @@ import soundfile
 from espnet.transform.transformation import Transformation
 
 
+def _parse_tokenid(tokenid):
+    """Parse the string of space-separated token IDs
+
+    :param: str tokenid: e.g. "1 2 3 4"
+    :return:
+    :rtype: np.ndarray
+    """
+    # NOTE: parse the whole string in C instead of int() per token
+    x = np.fromstring(tokenid, dtype=np.int64, sep=" ")
+    # NOTE: numpy<2 stops parsing at a malformed token and returns the parsed
+    #   prefix with only a DeprecationWarning, so check the length by ourselves
+    if len(x) != len(tokenid.split()):
+        raise ValueError("Invalid tokenid: {}".format(tokenid))
+    return x
+
+
 class LoadInputsAndTargets(object):
     """Create a mini-batch from a list of dicts
 
@@ -35,6 +54,9 @@ class LoadInputsAndTargets(object):
     :param: bool use_second_target: Used for tts mode only
     :param: dict preprocess_args: Set some optional arguments for preprocessing
     :param: Optional[dict] preprocess_args: Used for tts mode only
+    :param: bool keep_all_data_on_mem: Cache all loaded data on memory
+    :param: int num_workers: The number of threads to load the features of
+        the mini-batch in parallel. If 0, load them in the main thread.
     """
 
     def __init__(
@@ -48,6 +70,7 @@ class LoadInputsAndTargets(object):
         use_second_target=False,
         preprocess_args=None,
         keep_all_data_on_mem=False,
+        num_workers=0,
     ):
         self._loaders = {}
         if mode not in ["asr", "tts", "mt", "vc"]:
@@ -89,6 +112,24 @@ class LoadInputsAndTargets(object):
             self.preprocess_args = dict(preprocess_args)
 
         self.keep_all_data_on_mem = keep_all_data_on_mem
+        self.num_workers = num_workers
+        # NOTE: The thread pool is created at the first call in each process,
+        #   since neither a thread pool nor its threads survive pickling or fork
+        #   (e.g., passing this object to DataLoader workers).
+        self._executor = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_executor_pid"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     def __call__(self, batch, return_uttid=False):
         """Function to load inputs and targets from list of dicts
@@ -118,7 +159,7 @@ class LoadInputsAndTargets(object):
                     #  [{"feat": "some/path.h5:F01_050C0101_PED_REAL",
                     #    "filetype": "hdf5",
                     #    "name": "input1", ...}], ...}
-                    x = self._get_from_loader(
+                    x = self._load(
                         filepath=inp["feat"], filetype=inp.get("filetype", "mat")
                     )
                     x_feats_dict.setdefault(inp["name"], []).append(x)
@@ -128,37 +169,41 @@ class LoadInputsAndTargets(object):
                     if idx != 1 and len(info["input"]) > 1:
                         x = None
                     else:
-                        x = self._get_from_loader(
+                        x = self._load(
                             filepath=inp["feat"], filetype=inp.get("filetype", "mat")
                         )
                     x_feats_dict.setdefault(inp["name"], []).append(x)
 
             if self.load_output:
                 if self.mode == "mt":
-                    x = np.fromiter(
-                        map(int, info["output"][1]["tokenid"].split()), dtype=np.int64
-                    )
+                    x = _parse_tokenid(info["output"][1]["tokenid"])
                     x_feats_dict.setdefault(info["output"][1]["name"], []).append(x)
 
                 for idx, inp in enumerate(info["output"]):
                     if "tokenid" in inp:
                         # ======= Legacy format for output =======
                         # {"output": [{"tokenid": "1 2 3 4"}])
-                        x = np.fromiter(
-                            map(int, inp["tokenid"].split()), dtype=np.int64
-                        )
+                        x = _parse_tokenid(inp["tokenid"])
                     else:
                         # ======= New format =======
                         # {"input":
                         #  [{"feat": "some/path.h5:F01_050C0101_PED_REAL",
                         #    "filetype": "hdf5",
                         #    "name": "target1", ...}], ...}
-                        x = self._get_from_loader(
+                        x = self._load(
                             filepath=inp["feat"], filetype=inp.get("filetype", "mat")
                         )
 
                     y_feats_dict.setdefault(inp["name"], []).append(x)
 
+        if self.num_workers > 0:
+            # Wait for the features loaded in the thread pool
+            for feats_dict in [x_feats_dict, y_feats_dict]:
+                for name, feats in feats_dict.items():
+                    feats_dict[name] = [
+                        x.result() if isinstance(x, Future) else x for x in feats
+                    ]
+
         if self.mode == "asr":
             return_batch, uttid_list = self._create_batch_asr(
                 x_feats_dict, y_feats_dict, uttid_list
@@ -458,6 +503,29 @@ class LoadInputsAndTargets(object):
             return_batch = OrderedDict([(x_name, xs)])
         return return_batch, uttid_list
 
+    def _load(self, filepath, filetype):
+        """Return ndarray or Future of ndarray
+
+        If num_workers > 0, the loading is submitted to the thread pool
+        and its Future is returned instead of the ndarray.
+
+        :param: str filepath:
+        :param: str filetype:
+        :return:
+        :rtype: Union[np.ndarray, Future]
+        """
+        if self.num_workers <= 0:
+            return self._get_from_loader(filepath=filepath, filetype=filetype)
+        if self._executor is None or self._executor_pid != os.getpid():
+            # NOTE: In a forked child, the inherited pool has no threads and the
+            #   inherited lock may be held by a thread of the parent, so renew them
+            self._executor = ThreadPoolExecutor(max_workers=self.num_workers)
+            self._executor_pid = os.getpid()
+            self._lock = threading.Lock()
+        return self._executor.submit(
+            self._get_from_loader, filepath=filepath, filetype=filetype
+        )
+
     def _get_from_loader(self, filepath, filetype):
         """Return ndarray
 
@@ -479,11 +547,9 @@ class LoadInputsAndTargets(object):
             # -> filepath = "some/path.h5", key = "F01_050C0101_PED_REAL"
             filepath, key = filepath.split(":", 1)
 
-            loader = self._loaders.get(filepath)
-            if loader is None:
-                # To avoid disk access, create loader only for the first time
-                loader = h5py.File(filepath, "r")
-                self._loaders[filepath] = loader
+            loader = self._get_or_create_loader(
+                filepath, lambda: h5py.File(filepath, "r")
+            )
             return loader[key][()]
         elif filetype == "sound.hdf5":
             # e.g.
@@ -492,11 +558,9 @@ class LoadInputsAndTargets(object):
             # -> filepath = "some/path.h5", key = "F01_050C0101_PED_REAL"
             filepath, key = filepath.split(":", 1)
 
-            loader = self._loaders.get(filepath)
-            if loader is None:
-                # To avoid disk access, create loader only for the first time
-                loader = SoundHDF5File(filepath, "r", dtype="int16")
-                self._loaders[filepath] = loader
+            loader = self._get_or_create_loader(
+                filepath, lambda: SoundHDF5File(filepath, "r", dtype="int16")
+            )
             array, rate = loader[key]
             return array
         elif filetype == "sound":
@@ -517,11 +581,7 @@ class LoadInputsAndTargets(object):
             #                "filetype": "npz",
             filepath, key = filepath.split(":", 1)
 
-            loader = self._loaders.get(filepath)
-            if loader is None:
-                # To avoid disk access, create loader only for the first time
-                loader = np.load(filepath)
-                self._loaders[filepath] = loader
+            loader = self._get_or_create_loader(filepath, lambda: np.load(filepath))
             return loader[key]
         elif filetype == "npy":
             # e.g.
@@ -548,15 +608,33 @@ class LoadInputsAndTargets(object):
             #    {"input": [{"feat": "some/path.scp:F01_050C0101_PED_REAL",
             #                "filetype": "scp",
             filepath, key = filepath.split(":", 1)
-            loader = self._loaders.get(filepath)
-            if loader is None:
-                # To avoid disk access, create loader only for the first time
-                loader = kaldiio.load_scp(filepath)
-                self._loaders[filepath] = loader
+            loader = self._get_or_create_loader(
+                filepath, lambda: kaldiio.load_scp(filepath)
+            )
             return loader[key]
         else:
             raise NotImplementedError("Not supported: loader_type={}".format(filetype))
 
+    def _get_or_create_loader(self, filepath, create):
+        """Return the cached loader or create it only for the first time
+
+        The creation is guarded by a lock so that the threads loading
+        the mini-batch in parallel don't open the same file twice.
+
+        :param: str filepath:
+        :param: Callable create: Function to create the loader
+        :return:
+        """
+        loader = self._loaders.get(filepath)
+        if loader is None:
+            with self._lock:
+                loader = self._loaders.get(filepath)
+                if loader is None:
+                    # To avoid disk access, create loader only for the first time
+                    loader = create()
+                    self._loaders[filepath] = loader
+        return loader
+
 
 class SoundHDF5File(object):
     """Collecting sound files to a HDF5 file
@@ -449,11 +449,15 @@ def make_batchset(
             continue
 
         # sort it by input lengths (long to short)
-        sorted_data = sorted(
-            d.items(),
-            key=lambda data: int(data[1][batch_sort_key][batch_sort_axis]["shape"][0]),
-            reverse=not shortest_first,
+        # NOTE: stable argsort keeps the same order as sorted() for the same lengths
+        keys = list(d.keys())
+        lens = np.fromiter(
+            (int(d[k][batch_sort_key][batch_sort_axis]["shape"][0]) for k in keys),
+            dtype=np.int64,
+            count=len(keys),
         )
+        order = np.argsort(lens if shortest_first else -lens, kind="stable")
+        sorted_data = [(keys[i], d[keys[i]]) for i in order]
         logging.info("# utts: " + str(len(sorted_data)))
         if count == "seq":
             batches = batchfy_by_seq(
@@ -4,7 +4,6 @@
 
 """Hugging Face Transformers PostEncoder."""
 
-from espnet.nets.pytorch_backend.nets_utils import make_pad_mask
 from espnet2.asr.postencoder.abs_postencoder import AbsPostEncoder
 from transformers import AutoModel
 from typeguard import check_argument_types
@@ -68,7 +67,12 @@ class HuggingFaceTransformersPostEncoder(AbsPostEncoder):
 
         args = {"return_dict": True}
 
-        mask = (~make_pad_mask(input_lengths)).to(input.device).float()
+        # NOTE: The mask is made with tensor ops instead of make_pad_mask so that the
+        #   lengths are not fixed as constants when exported to ONNX
+        mask = (
+            torch.arange(input.size(1), device=input.device)[None, :]
+            < input_lengths[:, None].to(input.device)
+        ).float()
 
         if self.extend_attention_mask:
             args["attention_mask"] = _extend_attention_mask(mask)
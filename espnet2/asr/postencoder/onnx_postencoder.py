@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+#  Apache 2.0  (http://www.apache.org/licenses/LICENSE-2.0)
+
+"""ONNX Runtime PostEncoder."""
+
+from espnet2.asr.postencoder.abs_postencoder import AbsPostEncoder
+from pathlib import Path
+from typeguard import check_argument_types
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import logging
+import torch
+
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
+
+def export_postencoder(
+    model: AbsPostEncoder,
+    input_size: int,
+    out_path: Union[Path, str],
+    opset_version: int = 13,
+):
+    """Export the postencoder to an ONNX file.
+
+    Args:
+        model: PostEncoder to be exported.
+        input_size: Dimension of the input features.
+        out_path: Path of the output ONNX file.
+        opset_version: ONNX opset version.
+
+    """
+    assert check_argument_types()
+    x = torch.randn(2, 16, input_size)
+    x_lengths = torch.LongTensor([16, 8])
+    model.eval()
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (x, x_lengths),
+            str(out_path),
+            input_names=["input", "input_lengths"],
+            output_names=["output", "output_lengths"],
+            dynamic_axes={
+                "input": {0: "batch", 1: "length"},
+                "input_lengths": {0: "batch"},
+                "output": {0: "batch", 1: "length"},
+                "output_lengths": {0: "batch"},
+            },
+            opset_version=opset_version,
+        )
+    logging.info(f"PostEncoder is exported to {out_path}")
+
+
+class OnnxPostEncoder(AbsPostEncoder):
+    """PostEncoder running an exported ONNX model with ONNX Runtime.
+
+    This module is for inference only, i.e., no gradient is propagated, so an
+    error is raised if it is called in training mode.
+
+    """
+
+    def __init__(
+        self,
+        input_size: int,
+        model_path: Union[Path, str],
+        providers: Sequence[str] = ("CPUExecutionProvider",),
+    ):
+        """Initialize the module.
+
+        Args:
+            input_size: Dimension of the input features, which must match the
+                exported model.
+            model_path: Path of the ONNX file exported by export_postencoder.
+            providers: Execution providers of ONNX Runtime.
+
+        """
+        assert check_argument_types()
+        super().__init__()
+        if onnxruntime is None:
+            raise RuntimeError(
+                "onnxruntime is not installed. Do 'pip install onnxruntime'"
+            )
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        self.session = onnxruntime.InferenceSession(
+            str(model_path), options, providers=list(providers)
+        )
+        model_input_size = self.session.get_inputs()[0].shape[-1]
+        if model_input_size != input_size:
+            raise ValueError(
+                f"input_size={input_size} mismatches with the input dimension of "
+                f"{model_path}: {model_input_size}"
+            )
+        self._output_size = self.session.get_outputs()[0].shape[-1]
+
+    def forward(
+        self, input: torch.Tensor, input_lengths: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Forward."""
+        if self.training:
+            raise RuntimeError(
+                "OnnxPostEncoder is for inference only since the gradient is not "
+                "propagated through ONNX Runtime. Call eval() before using it."
+            )
+        output, output_lengths = self.session.run(
+            ["output", "output_lengths"],
+            {
+                "input": input.detach().cpu().numpy(),
+                "input_lengths": input_lengths.cpu().numpy(),
+            },
+        )
+        output = torch.from_numpy(output).to(input.device)
+        output_lengths = torch.from_numpy(output_lengths).to(input_lengths.device)
+        return output, output_lengths
+
+    def output_size(self) -> int:
+        """Get the output size."""
+        return self._output_size
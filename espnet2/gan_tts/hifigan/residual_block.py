@@ -43,8 +43,7 @@ class ResidualBlock(torch.nn.Module):
         super().__init__()
         self.use_additional_convs = use_additional_convs
         self.convs1 = torch.nn.ModuleList()
-        if use_additional_convs:
-            self.convs2 = torch.nn.ModuleList()
+        self.convs2 = torch.nn.ModuleList()
         assert kernel_size % 2 == 1, "Kernel size must be odd number."
         for dilation in dilations:
             self.convs1 += [
@@ -80,6 +79,10 @@ class ResidualBlock(torch.nn.Module):
                         ),
                     )
                 ]
+            else:
+                # NOTE: identity placeholder without parameters so that forward can be
+                #   written as a single loop which is also compatible with TorchScript
+                self.convs2 += [torch.nn.Identity()]
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Calculate forward propagation.
@@ -91,9 +94,7 @@ class ResidualBlock(torch.nn.Module):
             Tensor: Output tensor (B, channels, T).
 
         """
-        for idx in range(len(self.convs1)):
-            xt = self.convs1[idx](x)
-            if self.use_additional_convs:
-                xt = self.convs2[idx](xt)
+        for conv1, conv2 in zip(self.convs1, self.convs2):
+            xt = conv2(conv1(x))
             x = xt + x
         return x
@@ -7,6 +7,7 @@ This code is modified from https://github.com/kan-bayashi/ParallelWaveGAN.
 
 """
 
+import copy
 import math
 
 from typing import Optional
@@ -40,6 +41,51 @@ class Conv1d1x1(Conv1d):
         )
 
 
+@torch.jit.script
+def gated_activation(x: torch.Tensor, c: Optional[torch.Tensor] = None) -> torch.Tensor:
+    """Calculate gated activation with conditioning.
+
+    The conditioning addition, the split, and the tanh / sigmoid gate are written
+    as a single scripted function so that the fuser can emit one elementwise kernel
+    instead of launching a kernel (and allocating a buffer) for each of them.
+
+    Args:
+        x (Tensor): Output of dilated convolution (B, gate_channels, T).
+        c (Optional[Tensor]): Sum of the projected local and global conditioning
+            (B, gate_channels, T) or (B, gate_channels, 1).
+
+    Returns:
+        Tensor: Gated output tensor (B, gate_channels // 2, T).
+
+    """
+    if c is not None:
+        x = x + c
+    splitdim = 1
+    r = x.size(splitdim) // 2
+    return torch.tanh(x[:, :r]) * torch.sigmoid(x[:, r:])
+
+
+def merge_conditioning(
+    c: Optional[torch.Tensor], g: Optional[torch.Tensor]
+) -> Optional[torch.Tensor]:
+    """Sum the projected local and global conditioning into a single tensor.
+
+    Args:
+        c (Optional[Tensor]): Projected local conditioning (B, gate_channels, T).
+        g (Optional[Tensor]): Projected global conditioning (B, gate_channels, 1).
+
+    Returns:
+        Optional[Tensor]: Conditioning tensor added before the gate.
+
+    """
+    if c is None:
+        return g
+    if g is None:
+        return c
+    # NOTE: global conditioning is broadcasted over the time axis
+    return c + g
+
+
 class ResidualBlock(torch.nn.Module):
     """Residual block module in WaveNet."""
 
@@ -71,6 +117,8 @@ class ResidualBlock(torch.nn.Module):
         """
         super().__init__()
         self.dropout_rate = dropout_rate
+        self.kernel_size = kernel_size
+        self.dilation = dilation
         self.residual_channels = residual_channels
         self.skip_channels = skip_channels
         self.scale_residual = scale_residual
@@ -111,6 +159,9 @@ class ResidualBlock(torch.nn.Module):
             gate_out_channels, residual_channels + skip_channels, bias=bias
         )
 
+        # quantized linear layers replacing the conv layers (see to_quantized)
+        self.quantized_linears = None
+
     def forward(
         self,
         x: torch.Tensor,
@@ -133,28 +184,22 @@ class ResidualBlock(torch.nn.Module):
         """
         residual = x
         x = F.dropout(x, p=self.dropout_rate, training=self.training)
-        x = self.conv(x)
-
-        # split into two part for gated activation
-        splitdim = 1
-        xa, xb = x.split(x.size(splitdim) // 2, dim=splitdim)
+        x = self._apply_conv("conv", x)
 
         # local conditioning
         if c is not None:
-            c = self.conv1x1_aux(c)
-            ca, cb = c.split(c.size(splitdim) // 2, dim=splitdim)
-            xa, xb = xa + ca, xb + cb
+            c = self._apply_conv("conv1x1_aux", c)
 
         # global conditioning
         if g is not None:
-            g = self.conv1x1_glo(g)
-            ga, gb = g.split(g.size(splitdim) // 2, dim=splitdim)
-            xa, xb = xa + ga, xb + gb
+            g = self._apply_conv("conv1x1_glo", g)
 
-        x = torch.tanh(xa) * torch.sigmoid(xb)
+        # sum all the conditioning into a single bias, then split into two part and
+        # apply gated activation
+        x = gated_activation(x, merge_conditioning(c, g))
 
         # residual + skip 1x1 conv
-        x = self.conv1x1_out(x)
+        x = self._apply_conv("conv1x1_out", x)
         if x_mask is not None:
             x = x * x_mask
 
@@ -162,8 +207,75 @@ class ResidualBlock(torch.nn.Module):
         x, s = x.split([self.residual_channels, self.skip_channels], dim=1)
 
         # for residual connection
-        x = x + residual
         if self.scale_residual:
-            x = x * math.sqrt(0.5)
+            # NOTE: scale in-place to avoid allocating another (B, C, T) tensor
+            x = torch.add(x, residual).mul_(math.sqrt(0.5))
+        else:
+            x = x + residual
 
         return x, s
+
+    def _apply_conv(self, name: str, x: torch.Tensor) -> torch.Tensor:
+        """Apply the conv layer or its quantized linear layer over the taps.
+
+        Args:
+            name (str): Name of the conv layer.
+            x (Tensor): Input tensor (B, in_channels, T).
+
+        Returns:
+            Tensor: Output tensor (B, out_channels, T).
+
+        """
+        if self.quantized_linears is None:
+            return getattr(self, name)(x)
+        if name == "conv":
+            # gather the dilated taps: (B, C, T) -> (B, T, C * kernel_size)
+            batch_size, _, length = x.size()
+            padding = (self.kernel_size - 1) // 2 * self.dilation
+            x = F.pad(x, (padding, padding))
+            x = x.unfold(2, 2 * padding + 1, 1)[..., :: self.dilation]
+            x = x.transpose(1, 2).reshape(batch_size, length, -1)
+        else:
+            x = x.transpose(1, 2)
+        return self.quantized_linears[name](x).transpose(1, 2)
+
+    def to_quantized(self, dtype: torch.dtype = torch.qint8) -> "ResidualBlock":
+        """Return a copy of the block with int8 weights for inference.
+
+        Since PyTorch does not support the dynamic quantization of Conv1d, the conv
+        layers are converted into the equivalent linear layers over the dilated taps
+        and quantized by ``torch.quantization.quantize_dynamic``. The returned block
+        keeps only the quantized layers, i.e., the float conv layers are released,
+        and it is for inference only. Weight normalization must be removed
+        beforehand.
+
+        Args:
+            dtype (torch.dtype): Quantized data type.
+
+        Returns:
+            ResidualBlock: Quantized residual block.
+
+        """
+        linears = torch.nn.ModuleDict()
+        for name in ["conv", "conv1x1_aux", "conv1x1_glo", "conv1x1_out"]:
+            conv = getattr(self, name)
+            if conv is None:
+                continue
+            linear = torch.nn.Linear(
+                conv.in_channels * conv.kernel_size[0],
+                conv.out_channels,
+                bias=conv.bias is not None,
+            )
+            linear.weight.data.copy_(conv.weight.data.reshape(conv.out_channels, -1))
+            if conv.bias is not None:
+                linear.bias.data.copy_(conv.bias.data)
+            linears[name] = linear
+
+        # NOTE: the conv layers are replaced with None in the copy to avoid copying
+        #   the float weights which are no longer needed
+        memo = {id(getattr(self, name)): None for name in linears.keys()}
+        block = copy.deepcopy(self, memo)
+        block.quantized_linears = torch.quantization.quantize_dynamic(
+            linears, {torch.nn.Linear}, dtype=dtype
+        )
+        return block.eval()
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+import torch
+
+from espnet2.asr.postencoder.hugging_face_transformers_postencoder import (
+    HuggingFaceTransformersPostEncoder,  # noqa: H301
+)
+from espnet2.asr.postencoder.onnx_postencoder import export_postencoder
+from espnet2.asr.postencoder.onnx_postencoder import OnnxPostEncoder
+
+
+@pytest.fixture()
+def bert_path(tmp_path):
+    transformers = pytest.importorskip("transformers")
+    config = transformers.BertConfig(
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        intermediate_size=37,
+    )
+    transformers.BertModel(config).save_pretrained(tmp_path / "bert")
+    return str(tmp_path / "bert")
+
+
+@pytest.mark.execution_timeout(50)
+def test_onnx_postencoder_forward(tmp_path, bert_path):
+    pytest.importorskip("onnxruntime")
+    idim = 400
+    postencoder = HuggingFaceTransformersPostEncoder(idim, bert_path)
+    export_postencoder(postencoder, idim, tmp_path / "postencoder.onnx")
+    onnx_postencoder = OnnxPostEncoder(
+        input_size=idim, model_path=tmp_path / "postencoder.onnx"
+    )
+    x = torch.randn([4, 50, idim])
+    x_lengths = torch.LongTensor([20, 5, 50, 15])
+    with pytest.raises(RuntimeError):
+        onnx_postencoder(x, x_lengths)
+    onnx_postencoder.eval()
+
+    with torch.no_grad():
+        y, y_lengths = postencoder(x, x_lengths)
+    y_onnx, y_lengths_onnx = onnx_postencoder(x, x_lengths)
+    assert onnx_postencoder.output_size() == postencoder.output_size()
+    assert torch.equal(y_lengths_onnx, y_lengths)
+    np.testing.assert_allclose(y_onnx.numpy(), y.numpy(), rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.execution_timeout(50)
+def test_onnx_postencoder_input_size_mismatch(tmp_path, bert_path):
+    pytest.importorskip("onnxruntime")
+    postencoder = HuggingFaceTransformersPostEncoder(400, bert_path)
+    export_postencoder(postencoder, 400, tmp_path / "postencoder.onnx")
+    with pytest.raises(ValueError):
+        OnnxPostEncoder(input_size=80, model_path=tmp_path / "postencoder.onnx")
@@ -3,6 +3,8 @@
 
 """Test code for HiFi-GAN modules."""
 
+from distutils.version import LooseVersion
+
 import numpy as np
 import pytest
 import torch
@@ -13,6 +15,7 @@ from espnet2.gan_tts.hifigan.loss import DiscriminatorAdversarialLoss
 from espnet2.gan_tts.hifigan.loss import FeatureMatchLoss
 from espnet2.gan_tts.hifigan.loss import GeneratorAdversarialLoss
 from espnet2.gan_tts.hifigan.loss import MelSpectrogramLoss
+from espnet2.gan_tts.hifigan.residual_block import ResidualBlock
 
 
 def make_hifigan_generator_args(**kwargs):
@@ -201,3 +204,23 @@ def test_parallel_wavegan_compatibility():
             out_pwg.cpu().numpy(),
             out_espnet2.cpu().numpy(),
         )
+
+
+@pytest.mark.parametrize("use_additional_convs", [True, False])
+@pytest.mark.skipif(
+    LooseVersion(torch.__version__) < LooseVersion("1.8"),
+    reason="Pytorch >= 1.8 is required to script zip over ModuleList.",
+)
+def test_hifigan_residual_block_jit_script(use_additional_convs):
+    block = ResidualBlock(
+        kernel_size=3,
+        channels=4,
+        dilations=[1, 3],
+        use_additional_convs=use_additional_convs,
+    )
+    scripted_block = torch.jit.script(block)
+    x = torch.randn(2, 4, 16)
+    with torch.no_grad():
+        np.testing.assert_allclose(
+            scripted_block(x).numpy(), block(x).numpy(), rtol=1e-5, atol=1e-6
+        )
@@ -0,0 +1,68 @@
+# Copyright 2021 Tomoki Hayashi
+#  Apache 2.0  (http://www.apache.org/licenses/LICENSE-2.0)
+
+"""Test code for WaveNet residual block modules."""
+
+import numpy as np
+import pytest
+import torch
+
+from espnet2.gan_tts.wavenet.residual_block import ResidualBlock
+from espnet2.gan_tts.wavenet.residual_block import gated_activation
+from espnet2.gan_tts.wavenet.residual_block import merge_conditioning
+
+
+@pytest.mark.parametrize("use_c", [True, False])
+@pytest.mark.parametrize("use_g", [True, False])
+def test_gated_activation(use_c, use_g):
+    x = torch.randn(2, 8, 16)
+    c = torch.randn(2, 8, 16) if use_c else None
+    g = torch.randn(2, 8, 1) if use_g else None
+    xa, xb = x.split(4, dim=1)
+    if c is not None:
+        ca, cb = c.split(4, dim=1)
+        xa, xb = xa + ca, xb + cb
+    if g is not None:
+        ga, gb = g.split(4, dim=1)
+        xa, xb = xa + ga, xb + gb
+    expected = torch.tanh(xa) * torch.sigmoid(xb)
+    y = gated_activation(x, merge_conditioning(c, g))
+    np.testing.assert_allclose(y.numpy(), expected.numpy(), rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize("kernel_size", [1, 3, 5])
+@pytest.mark.parametrize("dilation", [1, 2])
+def test_residual_block_to_quantized(kernel_size, dilation):
+    block = ResidualBlock(
+        kernel_size=kernel_size,
+        residual_channels=64,
+        gate_channels=128,
+        skip_channels=64,
+        aux_channels=80,
+        global_channels=16,
+        dilation=dilation,
+    ).eval()
+    state_dict = {k: v.clone() for k, v in block.state_dict().items()}
+    quantized_block = block.to_quantized()
+    x = torch.randn(2, 64, 16)
+    x_mask = torch.ones(2, 1, 16)
+    c = torch.randn(2, 80, 16)
+    g = torch.randn(2, 16, 1)
+    with torch.no_grad():
+        y, s = block(x, x_mask=x_mask, c=c, g=g)
+        y_q, s_q = quantized_block(x, x_mask=x_mask, c=c, g=g)
+    assert y_q.shape == y.shape
+    assert s_q.shape == s.shape
+    # int8 weights and activations give a few percent of relative error
+    assert (y_q - y).norm() < 0.1 * y.norm()
+    assert (s_q - s).norm() < 0.1 * s.norm()
+
+    # the float conv layers are released in the quantized block
+    assert quantized_block.conv is None
+    assert quantized_block.conv1x1_out is None
+    assert all(p.dtype != torch.float32 for p in quantized_block.parameters())
+
+    # the float block is kept as it is
+    assert block.quantized_linears is None
+    for k, v in block.state_dict().items():
+        assert torch.equal(v, state_dict[k])
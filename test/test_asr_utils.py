@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from espnet.asr.asr_utils import save_attention_image
+
+
+@pytest.mark.parametrize("n_heads", [0, 1, 4])
+def test_save_attention_image(tmpdir, n_heads):
+    shape = (n_heads, 5, 7) if n_heads > 0 else (5, 7)
+    att_w = np.random.rand(*shape).astype(np.float16) * 0.5
+    filename = str(tmpdir.join("att.png"))
+    save_attention_image(att_w, filename)
+
+    image = np.asarray(Image.open(filename))
+    assert image.dtype == np.uint8
+    # heads are tiled horizontally
+    assert image.shape == (5, 7 * max(n_heads, 1))
+    assert image.min() == 0
+    assert image.max() == 255
+
+    att_w = att_w.astype(np.float32)
+    if n_heads > 0:
+        att_w = np.concatenate(list(att_w), axis=1)
+    att_w = att_w - att_w.min()
+    expected = (att_w / att_w.max() * 255).astype(np.uint8)
+    np.testing.assert_array_equal(image, expected)
+
+
+def test_save_attention_image_negative(tmpdir):
+    # e.g., log-mel filterbanks
+    feats = np.random.uniform(-10.0, -2.0, size=(5, 7)).astype(np.float32)
+    filename = str(tmpdir.join("fbank.png"))
+    save_attention_image(feats, filename)
+
+    image = np.asarray(Image.open(filename))
+    assert image.min() == 0
+    assert image.max() == 255
+    expected = (feats - feats.min()) / (feats.max() - feats.min()) * 255
+    np.testing.assert_allclose(image, expected, atol=1)
+
+
+@pytest.mark.parametrize("value", [0.0, -5.0])
+def test_save_attention_image_constant(tmpdir, value):
+    filename = str(tmpdir.join("att.png"))
+    save_attention_image(np.full((5, 7), value), filename)
+    np.testing.assert_array_equal(np.asarray(Image.open(filename)), 0)
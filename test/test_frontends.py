@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+import torch
+from torch_complex.tensor import ComplexTensor
+
+from espnet.nets.pytorch_backend.frontends.frontend import Frontend
+
+
+@pytest.mark.skipif(not hasattr(torch, "autocast"), reason="requires torch>=1.10")
+def test_frontend_amp_dtype():
+    torch.manual_seed(0)
+    frontend = Frontend(
+        idim=9,
+        use_wpe=True,
+        wunits=8,
+        wprojs=8,
+        use_beamformer=True,
+        bunits=8,
+        bprojs=8,
+        badim=8,
+        amp_dtype=torch.bfloat16,
+    ).eval()
+    x = ComplexTensor(torch.randn(2, 400, 3, 9), torch.randn(2, 400, 3, 9))
+    ilens = torch.LongTensor([400, 300])
+    with torch.no_grad():
+        h, hlens, _ = frontend(x, ilens)
+        frontend.amp_dtype = None
+        h_fp32, _, _ = frontend(x, ilens)
+
+    assert h.dtype == h_fp32.dtype == torch.float32
+    assert h.shape == h_fp32.shape == (2, 400, 9)
+    np.testing.assert_array_equal(hlens.numpy(), ilens.numpy())
+    for y, y_fp32 in [(h.real, h_fp32.real), (h.imag, h_fp32.imag)]:
+        assert (y - y_fp32).abs().mean() < 0.02 * y_fp32.abs().mean()
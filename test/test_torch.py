@@ -3,6 +3,7 @@
 import torch
 
 from espnet.nets.pytorch_backend.nets_utils import pad_list
+from espnet.nets.pytorch_backend.nets_utils import pad_list_even_max_length
 
 
 def test_pad_list():
@@ -14,6 +15,23 @@ def test_pad_list():
     assert xpad.data.tolist() == es
 
 
+def test_pad_list_keep_dtype():
+    xs = [torch.ones(3, 2, dtype=torch.int16), torch.ones(1, 2, dtype=torch.int16)]
+    xpad = pad_list(xs, 0)
+    assert xpad.dtype == torch.int16
+    assert xpad.shape == (2, 3, 2)
+    assert xpad[1, 1:].tolist() == [[0, 0], [0, 0]]
+
+
+def test_pad_list_even_max_length():
+    xs = [[1, 2, 3], [1, 2]]
+    xs = list(map(lambda x: torch.LongTensor(x), xs))
+    xpad = pad_list_even_max_length(xs, -1)
+
+    es = [[1, 2, 3, -1], [1, 2, -1, -1]]
+    assert xpad.data.tolist() == es
+
+
 def test_bmm_attention():
     b, t, h = 3, 2, 5
     enc_h = torch.randn(b, t, h)
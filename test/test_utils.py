@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
+import multiprocessing
+import pickle
+
 import h5py
 import kaldiio
 import numpy as np
 import pytest
 
+from espnet.utils.io_utils import _parse_tokenid
 from espnet.utils.io_utils import LoadInputsAndTargets
 from espnet.utils.io_utils import SoundHDF5File
 from espnet.utils.training.batchfy import make_batchset
@@ -66,7 +70,8 @@ def test_sortagrad(swap_io):
         prev_start_ilen = cur_start_ilen
 
 
-def test_load_inputs_and_targets_legacy_format(tmpdir):
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_load_inputs_and_targets_legacy_format(tmpdir, num_workers):
     # batch = [("F01_050C0101_PED_REAL",
     #          {"input": [{"feat": "some/path.ark:123"}],
     #           "output": [{"tokenid": "1 2 3 4"}],
@@ -97,7 +102,7 @@ def test_load_inputs_and_targets_legacy_format(tmpdir):
                 )
             )
 
-    load_inputs_and_targets = LoadInputsAndTargets()
+    load_inputs_and_targets = LoadInputsAndTargets(num_workers=num_workers)
     xs, ys = load_inputs_and_targets(batch)
     for x, xd in zip(xs, desire_xs):
         np.testing.assert_array_equal(x, xd)
@@ -105,6 +110,78 @@ def test_load_inputs_and_targets_legacy_format(tmpdir):
         np.testing.assert_array_equal(y, yd)
 
 
+@pytest.mark.parametrize(
+    "tokenid, expected", [("1 2 3 4", [1, 2, 3, 4]), ("5", [5]), ("", [])]
+)
+def test_parse_tokenid(tokenid, expected):
+    x = _parse_tokenid(tokenid)
+    assert x.dtype == np.int64
+    np.testing.assert_array_equal(x, expected)
+
+
+@pytest.mark.parametrize("tokenid", ["1 x 3", "1 2.5 3", "1 2 3x"])
+def test_parse_tokenid_invalid(tokenid):
+    with pytest.raises(ValueError):
+        _parse_tokenid(tokenid)
+
+
+def _load_and_put(load_inputs_and_targets, batch, queue):
+    queue.put(load_inputs_and_targets(batch))
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+def test_load_inputs_and_targets_num_workers_pickle_and_fork(tmpdir):
+    ark = str(tmpdir.join("test.ark"))
+    scp = str(tmpdir.join("test.scp"))
+
+    desire_xs = []
+    with kaldiio.WriteHelper("ark,scp:{},{}".format(ark, scp)) as f:
+        for i in range(4):
+            x = np.random.random((10, 5)).astype(np.float32)
+            f["uttid{}".format(i)] = x
+            desire_xs.append(x)
+
+    batch = [
+        (
+            "uttid{}".format(i),
+            {
+                "input": [
+                    {
+                        "feat": "{}:uttid{}".format(scp, i),
+                        "filetype": "scp",
+                        "name": "input1",
+                    }
+                ],
+                "output": [{"tokenid": "1 2 3 4", "name": "target1"}],
+            },
+        )
+        for i in range(4)
+    ]
+
+    load_inputs_and_targets = LoadInputsAndTargets(num_workers=2)
+    load_inputs_and_targets(batch)
+    assert len(load_inputs_and_targets._loaders) == 1
+
+    # The thread pool is dropped in pickling and rebuilt in the first call
+    restored = pickle.loads(pickle.dumps(load_inputs_and_targets))
+    assert restored._executor is None
+    xs, _ = restored(batch)
+    for x, xd in zip(xs, desire_xs):
+        np.testing.assert_array_equal(x, xd)
+
+    # The thread pool inherited from the parent is renewed in a forked child
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    p = ctx.Process(target=_load_and_put, args=(load_inputs_and_targets, batch, queue))
+    p.start()
+    xs, _ = queue.get(timeout=30)
+    p.join()
+    for x, xd in zip(xs, desire_xs):
+        np.testing.assert_array_equal(x, xd)
+
+
 def test_load_inputs_and_targets_legacy_format_multi_inputs(tmpdir):
     # batch = [("F01_050C0101_PED_REAL",
     #          {"input": [{"feat": "some/path1.ark:123",
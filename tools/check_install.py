@@ -5,7 +5,9 @@
 # Copyright 2018 Nagoya University (Tomoki Hayashi)
 #  Apache 2.0  (http://www.apache.org/licenses/LICENSE-2.0)
 
+from concurrent.futures import ProcessPoolExecutor
 import importlib
+import os
 import shutil
 import sys
 
@@ -36,9 +38,23 @@ executable_list = [
 ]
 
 
+def probe_module(name):
+    """Import the module and return whether it is found and its version."""
+    try:
+        m = importlib.import_module(name)
+    except ImportError:
+        return False, None
+    return True, getattr(m, "__version__", None)
+
+
 def main():
     """Check the installation."""
 
+    # NOTE: Import the modules in worker processes in parallel, which overlaps
+    #   with checking torch, chainer, and cupy in the main process below
+    executor = ProcessPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+    futures = [executor.submit(probe_module, name) for name, _, _ in module_list]
+
     python_version = sys.version.replace("\n", " ")
     print(f"[x] python={python_version}")
 
@@ -104,23 +120,22 @@ def main():
         print("[ ] cupy")
 
     to_install = []
-    for name, versions, installer in module_list:
-        try:
-            m = importlib.import_module(name)
-            if hasattr(m, "__version__"):
-                version = m.__version__
-                print(f"[x] {name}={version}")
-                if versions is not None and version not in versions:
-                    print(
-                        f"Warning! {name}={version} is not suppoted. "
-                        "Supported versions are {versions}"
-                    )
-            else:
-                print(f"[x] {name}")
-        except ImportError:
+    for (name, versions, installer), future in zip(module_list, futures):
+        found, version = future.result()
+        if not found:
             print(f"[ ] {name}")
             if installer is not None:
                 to_install.append(f"Use '{installer}' to install {name}")
+        elif version is not None:
+            print(f"[x] {name}={version}")
+            if versions is not None and version not in versions:
+                print(
+                    f"Warning! {name}={version} is not suppoted. "
+                    "Supported versions are {versions}"
+                )
+        else:
+            print(f"[x] {name}")
+    executor.shutdown()
 
     print()
     print("Executables:")